@@ -3,18 +3,36 @@ import click
 import sys
 import os
 import logging
+import codecs
+import mmap
+import zipfile
 import json
-import base64
-import pickle
-import tempfile
-import uuid
+from functools import lru_cache
 
 from ladybug.color import Color
-from honeybee_display.attr import FaceAttribute, RoomAttribute
 
 from dragonfly.model import Model
 from dragonfly.cli import main
 
+try:  # orjson parses and serializes large files much faster than json
+    import orjson
+except ImportError:  # orjson is not installed; use the standard library
+    orjson = None
+
+# VisualizationSet dictionaries are trees so there is no need to check for cycles
+_JSON_ENCODER = json.JSONEncoder(
+    check_circular=False, ensure_ascii=False, separators=(',', ':'))
+
+# name of the user cache sub-folder where parsed models are cached and the maximum
+# age in seconds that a cached model is kept before it is cleaned up
+_CACHE_FOLDER_NAME = 'dragonfly-display'
+_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# acceptable formats for the output of the VisualizationSet
+_OUTPUT_FORMATS = ('vsf', 'json', 'pkl', 'vtkjs', 'html')
+# formats only available when the command functions are called from Python
+_PYTHON_OUTPUT_FORMATS = _OUTPUT_FORMATS + ('obj',)
+
 
 _logger = logging.getLogger(__name__)
 
@@ -112,16 +130,30 @@ def display():
     'extensions (since both .vsf and .json can be acceptable). Also note that '
     'ladybug-vtk must be installed in order for the vtkjs or html options to be usable '
     'and the html format refers to a web page with the vtkjs file embedded within it.',
-    type=str, default='vsf', show_default=True)
+    type=click.Choice(_OUTPUT_FORMATS, case_sensitive=False), default='vsf',
+    show_default=True)
 @click.option(
     '--output-file', help='Optional file to output the string of the visualization '
     'file contents. By default, it will be printed out to stdout.',
     type=click.File('w'), default='-', show_default=True)
+@click.option(
+    '--encode-vtkjs/--raw-vtkjs', ' /-rv', help='Flag to note whether a vtkjs '
+    'printed to stdout should be encoded as a base64 string or the raw binary of '
+    'the file should be written. Raw binary is smaller and faster to pipe into '
+    'another program but base64 will still be used if stdout does not accept bytes.',
+    default=True, show_default=True)
+@click.option(
+    '--no-cache/--cache', ' /-ca', help='Flag to note whether the parsed Model '
+    'should be cached in a private folder of the user cache directory such that '
+    'subsequent visualizations of the same unchanged model file can skip the '
+    'parsing of the JSON. Note that the Model is still rebuilt from the cached '
+    'data and so this only saves significant time when orjson is not installed.',
+    default=True, show_default=True)
 def model_to_vis_set_cli(
         model_file, multiplier, plenum, no_ceil_adjacency,
         color_by, wireframe, mesh, show_color_by,
         room_attr, face_attr, color_attr, grid_display_mode, show_grid,
-        output_format, output_file):
+        output_format, output_file, encode_vtkjs, no_cache):
     """Translate a Dragonfly Model file (.dfjson) to a VisualizationSet file (.vsf).
 
     This command can also optionally translate the Dragonfly Model to a .vtkjs file,
@@ -143,12 +175,14 @@ def model_to_vis_set_cli(
         face_attrs = [] if len(face_attr) == 0 or face_attr[0] == '' else face_attr
         text_labels = not color_attr
         hide_grid = not show_grid
+        raw_vtkjs = not encode_vtkjs
+        cache = not no_cache
 
         # pass the input to the function in order to convert the model
         model_to_vis_set(model_file, full_geometry, no_plenum, ceil_adjacency, color_by,
                          exclude_wireframe, faces, hide_color_by,
                          room_attrs, face_attrs, text_labels, grid_display_mode,
-                         hide_grid, output_format, output_file)
+                         hide_grid, output_format, output_file, raw_vtkjs, cache)
     except Exception as e:
         _logger.exception('Failed to translate Model to VisualizationSet.\n{}'.format(e))
         sys.exit(1)
@@ -160,9 +194,10 @@ def model_to_vis_set(
     model_file, full_geometry=False, no_plenum=False, ceil_adjacency=False,
     color_by='type', exclude_wireframe=False, faces=False, hide_color_by=False,
     room_attr=(), face_attr=(), text_attr=False, grid_display_mode='Default',
-    hide_grid=False, output_format='vsf', output_file=None,
-    multiplier=True, plenum=True, no_ceil_adjacency=True, wireframe=True, mesh=True,
-    show_color_by=True, color_attr=True, show_grid=True
+    hide_grid=False, output_format='vsf', output_file=None, raw_vtkjs=False,
+    cache=False, multiplier=True, plenum=True, no_ceil_adjacency=True, wireframe=True,
+    mesh=True, show_color_by=True, color_attr=True, show_grid=True, encode_vtkjs=True,
+    no_cache=True
 ):
     """Translate a Dragonfly Model file (.dfjson) to a VisualizationSet file (.vsf).
 
@@ -234,13 +269,27 @@ def model_to_vis_set(
             coordinating file extensions (since both .vsf and .json can be
             acceptable). Also note that ladybug-vtk must be installed in order
             for the vtkjs or html options to be usable and the html format
-            refers to a web page with the vtkjs file embedded within it.
+            refers to a web page with the vtkjs file embedded within it. When
+            calling this function from Python, obj can also be used to return
+            the VisualizationSet object itself, in which case the output_file
+            is ignored.
         output_file: Optional file to output the string of the visualization
             file contents. If None, the string will simply be returned from
             this method.
+        raw_vtkjs: Boolean to note whether a vtkjs output to stdout should be
+            written as the raw binary of the file instead of a base64 string. A
+            base64 string is still used when the stdout does not accept bytes
+            or the output_file is None. (Default: False).
+        cache: Boolean to note whether the parsed Model should be cached in a
+            private folder of the user cache directory such that subsequent
+            visualizations of the same unchanged model file can skip the parsing
+            of the JSON. Note that the Model is still rebuilt from the cached
+            data and so this only saves significant time when orjson is not
+            installed. (Default: False).
     """
-    # load the model object and process simpler attributes
-    model_obj = Model.from_file(model_file)
+    # check the output format and load the model object
+    output_format = _check_output_format(output_format)
+    model_obj = _load_model(model_file, cache)
     room_attrs = [room_attr] if isinstance(room_attr, str) else room_attr
     face_attrs = [face_attr] if isinstance(face_attr, str) else face_attr
     wireframe = not exclude_wireframe
@@ -248,14 +297,10 @@ def model_to_vis_set(
     color_attr = not text_attr
 
     # load the room and face attributes
-    face_attributes = []
-    for fa in face_attrs:
-        faa = FaceAttribute(name=fa, attrs=[fa], color=color_attr, text=text_attr)
-        face_attributes.append(faa)
-    room_attributes = []
-    for ra in room_attrs:
-        raa = RoomAttribute(name=ra, attrs=[ra], color=color_attr, text=text_attr)
-        room_attributes.append(raa)
+    face_attributes = [_face_attribute(fa, color_attr, text_attr)
+                       for fa in face_attrs] if face_attrs else []
+    room_attributes = [_room_attribute(ra, color_attr, text_attr)
+                       for ra in room_attrs] if room_attrs else []
 
     # create the VisualizationSet
     multiplier = not full_geometry
@@ -266,7 +311,7 @@ def model_to_vis_set(
         grid_display_mode=grid_display_mode, hide_grid=hide_grid)
 
     # output the VisualizationSet through the CLI
-    return _output_vis_set_to_format(vis_set, output_format, output_file)
+    return _output_vis_set_to_format(vis_set, output_format, output_file, raw_vtkjs)
 
 
 @display.command('model-comparison-to-vis')
@@ -303,14 +348,29 @@ def model_to_vis_set(
     'extensions (since both .vsf and .json can be acceptable). Also note that '
     'ladybug-vtk must be installed in order for the vtkjs or html options to be usable '
     'and the html format refers to a web page with the vtkjs file embedded within it.',
-    type=str, default='vsf', show_default=True)
+    type=click.Choice(_OUTPUT_FORMATS, case_sensitive=False), default='vsf',
+    show_default=True)
 @click.option(
     '--output-file', help='Optional file to output the he string of the visualization '
-    'file contents. By default, it will be printed out to stdout',
+    'file contents. By default, it will be printed out to stdout.',
     type=click.File('w'), default='-', show_default=True)
+@click.option(
+    '--encode-vtkjs/--raw-vtkjs', ' /-rv', help='Flag to note whether a vtkjs '
+    'printed to stdout should be encoded as a base64 string or the raw binary of '
+    'the file should be written. Raw binary is smaller and faster to pipe into '
+    'another program but base64 will still be used if stdout does not accept bytes.',
+    default=True, show_default=True)
+@click.option(
+    '--no-cache/--cache', ' /-ca', help='Flag to note whether the parsed Models '
+    'should be cached in a private folder of the user cache directory such that '
+    'subsequent visualizations of the same unchanged model files can skip the '
+    'parsing of the JSON. Note that the Models are still rebuilt from the cached '
+    'data and so this only saves significant time when orjson is not installed.',
+    default=True, show_default=True)
 def model_comparison_to_vis_set_cli(
         base_model_file, incoming_model_file, multiplier, plenum, no_ceil_adjacency,
-        base_color, incoming_color, output_format, output_file):
+        base_color, incoming_color, output_format, output_file, encode_vtkjs,
+        no_cache):
     """Translate two Dragonfly Models to be compared to a VisualizationSet.
 
     This command can also optionally translate the Dragonfly Model to a .vtkjs file,
@@ -330,11 +390,14 @@ def model_comparison_to_vis_set_cli(
         full_geometry = not multiplier
         no_plenum = not plenum
         ceil_adjacency = not no_ceil_adjacency
+        raw_vtkjs = not encode_vtkjs
+        cache = not no_cache
 
         # pass the input to the function in order to convert the model
         model_comparison_to_vis_set(
             base_model_file, incoming_model_file, full_geometry, no_plenum,
-            ceil_adjacency, base_color, incoming_color, output_format, output_file)
+            ceil_adjacency, base_color, incoming_color, output_format, output_file,
+            raw_vtkjs, cache)
     except Exception as e:
         _logger.exception('Failed to translate Model to VisualizationSet.\n{}'.format(e))
         sys.exit(1)
@@ -345,8 +408,9 @@ def model_comparison_to_vis_set_cli(
 def model_comparison_to_vis_set(
     base_model_file, incoming_model_file, full_geometry=False, no_plenum=False,
     ceil_adjacency=False, base_color='#74eded', incoming_color='#ed7474',
-    output_format='vsf', output_file=None,
-    multiplier=True, plenum=True, no_ceil_adjacency=True
+    output_format='vsf', output_file=None, raw_vtkjs=False, cache=False,
+    multiplier=True, plenum=True, no_ceil_adjacency=True, encode_vtkjs=True,
+    no_cache=True
 ):
     """Translate two Honeybee Models to be compared to a VisualizationSet.
 
@@ -381,14 +445,31 @@ def model_comparison_to_vis_set(
             coordinating file extensions (since both .vsf and .json can be
             acceptable). Also note that ladybug-vtk must be installed in order
             for the vtkjs or html options to be usable and the html format
-            refers to a web page with the vtkjs file embedded within it.
+            refers to a web page with the vtkjs file embedded within it. When
+            calling this function from Python, obj can also be used to return
+            the VisualizationSet object itself, in which case the output_file
+            is ignored.
         output_file: Optional file to output the string of the visualization
             file contents. If None, the string will simply be returned from
             this method.
+        raw_vtkjs: Boolean to note whether a vtkjs output to stdout should be
+            written as the raw binary of the file instead of a base64 string. A
+            base64 string is still used when the stdout does not accept bytes
+            or the output_file is None. (Default: False).
+        cache: Boolean to note whether the parsed Models should be cached in a
+            private folder of the user cache directory such that subsequent
+            visualizations of the same unchanged model files can skip the parsing
+            of the JSON. Note that the Models are still rebuilt from the cached
+            data and so this only saves significant time when orjson is not
+            installed. (Default: False).
     """
-    # load the model objects and process the colors from the hex codes
-    base_model = Model.from_file(base_model_file)
-    incoming_model = Model.from_file(incoming_model_file)
+    # check the output format, load the models and process the hex colors
+    output_format = _check_output_format(output_format)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=2) as executor:  # load models concurrently
+        base_future = executor.submit(_load_model, base_model_file, cache)
+        incoming_future = executor.submit(_load_model, incoming_model_file, cache)
+        base_model, incoming_model = base_future.result(), incoming_future.result()
     base_color = Color.from_hex(base_color)
     incoming_color = Color.from_hex(incoming_color)
     base_color.a = 128
@@ -401,10 +482,163 @@ def model_comparison_to_vis_set(
         base_color, incoming_color)
 
     # output the VisualizationSet through the CLI
-    return _output_vis_set_to_format(vis_set, output_format, output_file)
+    return _output_vis_set_to_format(vis_set, output_format, output_file, raw_vtkjs)
+
+
+@lru_cache(maxsize=256)
+def _face_attribute(name, color, text):
+    """Get a FaceAttribute for a single attribute name, reusing previous ones."""
+    from honeybee_display.attr import FaceAttribute
+    return FaceAttribute(name=name, attrs=(name,), color=color, text=text)
 
 
-def _output_vis_set_to_format(vis_set, output_format, output_file):
+@lru_cache(maxsize=256)
+def _room_attribute(name, color, text):
+    """Get a RoomAttribute for a single attribute name, reusing previous ones."""
+    from honeybee_display.attr import RoomAttribute
+    return RoomAttribute(name=name, attrs=(name,), color=color, text=text)
+
+
+def _check_output_format(output_format):
+    """Check that an output format is acceptable and return it in lowercase."""
+    output_format = output_format.lower()
+    if output_format not in _PYTHON_OUTPUT_FORMATS:
+        raise ValueError('Unrecognized output-format "{}".'.format(output_format))
+    return output_format
+
+
+def _load_model(model_file, cache=False):
+    """Load a Dragonfly Model from a file, optionally using a cache of parsed models.
+
+    Cached models are stored as DFpkl files in a sub-folder of the user cache
+    directory and they are keyed by the full path, modified time and size of the
+    model file such that any change to the file invalidates the cached model.
+    Since cached models are unpickled, the cache is not used if its folder
+    could have been written by another user.
+
+    Args:
+        model_file: Path to a Dragonfly Model (DFJSON or DFpkl) file.
+        cache: Boolean to note whether the cache should be used. (Default: False).
+    """
+    if not cache:
+        return _model_from_file(model_file)
+    import hashlib
+    # check that the cache folder is private to the user
+    cache_folder = _cache_folder()
+    try:
+        os.makedirs(cache_folder, mode=0o700, exist_ok=True)
+        private_folder = _is_private_folder(cache_folder)
+    except OSError:
+        private_folder = False
+    if not private_folder:
+        _logger.warning('Model cache folder "{}" is not private to the current '
+                        'user and will not be used.'.format(cache_folder))
+        return _model_from_file(model_file)
+    # get the path to the cached model file
+    f_stat = os.stat(model_file)
+    cache_key = '{}|{}|{}'.format(
+        os.path.abspath(model_file), f_stat.st_mtime_ns, f_stat.st_size)
+    cache_file = os.path.join(
+        cache_folder, hashlib.sha1(cache_key.encode('utf-8')).hexdigest() + '.dfpkl')
+    # load the model from the cache if it exists
+    if os.path.isfile(cache_file):
+        try:
+            return _model_from_file(cache_file)
+        except Exception:  # corrupted cache file; parse the original file
+            pass
+    model = _model_from_file(model_file)
+    try:
+        _write_model_cache(model, cache_folder, cache_file)
+    except (IOError, OSError) as e:  # the cache is an optimization; don't fail
+        _logger.warning('Failed to cache Model.\n{}'.format(e))
+    return model
+
+
+def _cache_folder():
+    """Get the path to the folder where parsed models are cached for the user."""
+    if os.name == 'nt':
+        base_folder = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base_folder = os.environ.get('XDG_CACHE_HOME') or \
+            os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_folder, _CACHE_FOLDER_NAME)
+
+
+def _is_private_folder(folder):
+    """Check that a folder is owned by the user and not writable by anyone else."""
+    import stat
+    f_stat = os.lstat(folder)
+    if not stat.S_ISDIR(f_stat.st_mode):  # symbolic link or file
+        return False
+    if not hasattr(os, 'getuid'):  # Windows, where user folders are private
+        return True
+    return f_stat.st_uid == os.getuid() and \
+        not f_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _model_from_file(model_file):
+    """Load a Dragonfly Model from a file, memory-mapping DFJSON and DFpkl files.
+
+    JSON files are parsed with orjson when it is available (or the standard
+    library json module otherwise) and pkl files are unpickled directly from
+    the memory map.
+
+    Args:
+        model_file: Path to a Dragonfly Model (DFJSON or DFpkl) file. This can also
+            be a HBJSON or a HBpkl from which a Dragonfly model should be derived.
+    """
+    if zipfile.is_zipfile(model_file):
+        return Model.from_file(model_file)
+    # check the first characters to see whether the file is JSON
+    bom = codecs.BOM_UTF8
+    with open(model_file, 'rb') as inf:
+        start = inf.read(1024)
+    if start.startswith(bom):
+        start = start[len(bom):]
+    is_json = start.lstrip()[:1] == b'{'  # pickles never start with whitespace
+    if is_json and orjson is None:  # parse the JSON with the standard library
+        with open(model_file, encoding='utf-8-sig') as inf:
+            data = json.load(inf)
+    else:  # parse the contents of the memory-mapped file
+        with open(model_file, 'rb') as inf:
+            with mmap.mmap(inf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if is_json:
+                    st_i = len(bom) if mm[:len(bom)] == bom else 0
+                    with memoryview(mm) as mv:
+                        data = orjson.loads(mv[st_i:])
+                else:  # assume that it is a pkl file
+                    import pickle
+                    data = pickle.loads(mm)
+    # load the model using the same logic as Model.from_dfjson and Model.from_dfpkl
+    if 'buildings' in data or 'context_shades' in data:
+        return Model.from_dict(data)
+    # assume that it's a Honeybee Model to translate
+    from honeybee.model import Model as HBModel
+    return Model.from_honeybee(HBModel.from_dict(data))
+
+
+def _write_model_cache(model, cache_folder, cache_file):
+    """Write a Model to the cache folder and clean up any stale cached models."""
+    import time
+    import uuid
+    import pickle
+    # remove any cached models that have not been written recently
+    now = time.time()
+    for f_name in os.listdir(cache_folder):
+        f_path = os.path.join(cache_folder, f_name)
+        try:
+            if now - os.path.getmtime(f_path) > _CACHE_MAX_AGE:
+                os.remove(f_path)
+        except OSError:  # file was removed by another process
+            pass
+    # write the model to a temporary file and move it so readers never see partials
+    temp_file = '{}.{}.tmp'.format(cache_file, uuid.uuid4().hex)
+    with open(temp_file, 'wb') as fp:
+        pickle.dump(model.to_dict(), fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, cache_file)
+
+
+def _output_vis_set_to_format(vis_set, output_format, output_file, raw_vtkjs=False):
     """Process a VisualizationSet for output from the CLI.
 
     Args:
@@ -413,34 +647,39 @@ def _output_vis_set_to_format(vis_set, output_format, output_file):
         output_file: Optional file to output the string of the visualization
             file contents. If None, the string will simply be returned from
             this method.
+        raw_vtkjs: Boolean to note whether a vtkjs output to stdout should be
+            written as the raw binary of the file. (Default: False).
     """
     # output the visualization in the correct format
     output_format = output_format.lower()
+    if output_format == 'obj':
+        return vis_set
+    if output_format in ('vsf', 'json', 'pkl'):
+        vs_dict = vis_set.to_dict()
     if output_format in ('vsf', 'json'):
         if output_file is None:
-            return json.dumps(vis_set.to_dict())
-        elif isinstance(output_file, str):
-            with open(output_file, 'w') as of:
-                of.write(json.dumps(vis_set.to_dict()))
-        else:
-            output_file.write(json.dumps(vis_set.to_dict()))
+            return _vis_set_dict_to_json(vs_dict)
+        _write_vis_set_json(vs_dict, output_file)
     elif output_format == 'pkl':
+        import pickle
         if output_file is None:
-            return pickle.dumps(vis_set.to_dict())
-        elif isinstance(output_file, str):
-            with open(output_file, 'w') as of:
-                of.write(pickle.dumps(vis_set.to_dict()))
-        elif output_file.name == '<stdout>':
-            output_file.write(pickle.dumps(vis_set.to_dict()))
+            return pickle.dumps(vs_dict, protocol=pickle.HIGHEST_PROTOCOL)
+        elif not isinstance(output_file, str) and output_file.name == '<stdout>':
+            output_file.flush()  # pickles must go to the binary buffer
+            pickle.dump(vs_dict, output_file.buffer, protocol=pickle.HIGHEST_PROTOCOL)
+            output_file.buffer.flush()
         else:
-            out_folder, out_file = os.path.split(output_file.name)
-            vis_set.to_pkl(out_file, out_folder)
+            f_path = output_file if isinstance(output_file, str) else output_file.name
+            with open(f_path, 'wb') as of:
+                pickle.dump(vs_dict, of, protocol=pickle.HIGHEST_PROTOCOL)
     elif output_format in ('vtkjs', 'html'):
+        temp_folder = None
         if output_file is None or (not isinstance(output_file, str)
                                    and output_file.name == '<stdout>'):
-            # get a temporary file
-            out_file = str(uuid.uuid4())[:6]
-            out_folder = tempfile.gettempdir()
+            # get a temporary file in a folder that only this call can use
+            import tempfile
+            temp_folder = out_folder = tempfile.mkdtemp()
+            out_file = 'vis_set'
         else:
             f_path = output_file if isinstance(output_file, str) else output_file.name
             out_folder, out_file = os.path.split(f_path)
@@ -449,33 +688,109 @@ def _output_vis_set_to_format(vis_set, output_format, output_file):
             elif out_file.endswith('.html'):
                 out_file = out_file[:-5]
         try:
-            if output_format == 'vtkjs':
-                vis_set.to_vtkjs(output_folder=out_folder, file_name=out_file)
-            if output_format == 'html':
-                vis_set.to_html(output_folder=out_folder, file_name=out_file)
-        except AttributeError as ae:
-            raise AttributeError(
-                'Ladybug-vtk must be installed in order to use --output-format '
-                'vtkjs.\n{}'.format(ae))
-        if output_file is None or (not isinstance(output_file, str)
-                                   and output_file.name == '<stdout>'):
-            # load file contents
-            out_file_ext = out_file + '.' + output_format
-            out_file_path = os.path.join(out_folder, out_file_ext)
-            if output_format == 'html':
-                with open(out_file_path, encoding='utf-8') as of:
-                    f_contents = of.read()
-            else:  # vtkjs can only be read as binary
-                with open(out_file_path, 'rb') as of:
-                    f_contents = of.read()
-                b = base64.b64encode(f_contents)
-                f_contents = b.decode('utf-8')
-            if output_file is None:
-                return f_contents
-            output_file.write(f_contents)
+            try:
+                if output_format == 'vtkjs':
+                    vis_set.to_vtkjs(output_folder=out_folder, file_name=out_file)
+                if output_format == 'html':
+                    vis_set.to_html(output_folder=out_folder, file_name=out_file)
+            except AttributeError as ae:
+                raise AttributeError(
+                    'Ladybug-vtk must be installed in order to use --output-format '
+                    'vtkjs.\n{}'.format(ae))
+            if temp_folder is not None:  # load the contents of the temporary file
+                out_file_ext = out_file + '.' + output_format
+                out_file_path = os.path.join(out_folder, out_file_ext)
+                return _read_temp_vis_file(
+                    out_file_path, output_format, output_file, raw_vtkjs)
+        finally:
+            if temp_folder is not None:  # remove the temporary folder
+                import shutil
+                shutil.rmtree(temp_folder, ignore_errors=True)
     else:
         raise ValueError('Unrecognized output-format "{}".'.format(output_format))
 
 
+def _read_temp_vis_file(file_path, output_format, output_file=None, raw=False):
+    """Read a temporary vtkjs or html file to stdout or to a returned string.
+
+    Args:
+        file_path: Path to the temporary vtkjs or html file.
+        output_format: Text for the format of the file. Either vtkjs or html.
+        output_file: An optional stdout stream to which the file contents will
+            be copied in chunks. If None, the contents of the file will be returned
+            as a string (base64-encoded for vtkjs).
+        raw: Boolean to note whether a vtkjs file should be copied to the binary
+            buffer of the output_file instead of being base64-encoded. This is
+            ignored if the output_file has no binary buffer. (Default: False).
+    """
+    import shutil
+    chunk_size = 1024 * 1024
+    if output_format == 'html':
+        with open(file_path, encoding='utf-8') as of:
+            if output_file is None:
+                return of.read()
+            shutil.copyfileobj(of, output_file, chunk_size)
+    elif raw and output_file is not None and hasattr(output_file, 'buffer'):
+        # write the binary without base64 encoding
+        output_file.flush()
+        with open(file_path, 'rb') as of:
+            shutil.copyfileobj(of, output_file.buffer, chunk_size)
+        output_file.buffer.flush()
+    else:  # vtkjs can only be read as binary
+        import base64
+        b64_chunk = 3 * 1024 * 256  # multiple of 3 so the chunks have no padding
+        with open(file_path, 'rb') as of:
+            with mmap.mmap(of.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if output_file is None:
+                    return base64.b64encode(mm).decode('ascii')
+                for i in range(0, len(mm), b64_chunk):
+                    chunk = mm[i:i + b64_chunk]
+                    output_file.write(base64.b64encode(chunk).decode('ascii'))
+
+
+def _vis_set_dict_to_json(vs_dict):
+    """Get a JSON string from a VisualizationSet dictionary."""
+    if orjson is None:
+        return _JSON_ENCODER.encode(vs_dict)
+    return orjson.dumps(vs_dict, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+
+
+def _write_vis_set_json(vs_dict, output_file):
+    """Write a VisualizationSet dictionary to a file path or file object as JSON.
+
+    The JSON is always written as UTF-8. When the output file is a text stream
+    with a binary buffer underneath it (like stdout), the encoded bytes are
+    written straight to that buffer. If orjson is not available, the JSON is
+    streamed in chunks so that the full string is never held in memory.
+    """
+    # write the JSON to a file path
+    if isinstance(output_file, str):
+        if orjson is None:
+            with open(output_file, 'w', encoding='utf-8') as of:
+                for chunk in _JSON_ENCODER.iterencode(vs_dict):
+                    of.write(chunk)
+        else:
+            with open(output_file, 'wb') as of:
+                of.write(orjson.dumps(vs_dict, option=orjson.OPT_SERIALIZE_NUMPY))
+        return
+    # write the JSON to a stream
+    try:
+        buffer = output_file.buffer
+    except AttributeError:  # a text stream without a binary buffer
+        if orjson is None:
+            for chunk in _JSON_ENCODER.iterencode(vs_dict):
+                output_file.write(chunk)
+        else:
+            output_file.write(_vis_set_dict_to_json(vs_dict))
+        return
+    output_file.flush()
+    if orjson is None:
+        for chunk in _JSON_ENCODER.iterencode(vs_dict):
+            buffer.write(chunk.encode('utf-8'))
+    else:
+        buffer.write(orjson.dumps(vs_dict, option=orjson.OPT_SERIALIZE_NUMPY))
+    buffer.flush()
+
+
 # add display sub-group to dragonfly CLI
 main.add_command(display)
@@ -1,7 +1,10 @@
 """Method to translate a Dragonfly Model to a VisualizationSet."""
-from honeybee_display.model import model_to_vis_set as hb_model_to_vis_set
-from honeybee_display.model import model_comparison_to_vis_set as \
-    hb_model_comparison_to_vis_set
+import threading
+from collections import OrderedDict
+
+# cache of translated Honeybee Models used when use_cache is True
+_HB_MODEL_CACHE = OrderedDict()
+_HB_MODEL_CACHE_SIZE = 8
 
 
 def model_to_vis_set(
@@ -9,7 +12,7 @@ def model_to_vis_set(
         solve_ceiling_adjacencies=False,
         color_by='type', include_wireframe=True, use_mesh=True,
         hide_color_by=False, room_attrs=None, face_attrs=None,
-        grid_display_mode='Default', hide_grid=False):
+        grid_display_mode='Default', hide_grid=False, use_cache=False):
     """Translate a Dragonfly Model to a VisualizationSet.
 
     Args:
@@ -28,8 +31,7 @@ def model_to_vis_set(
         solve_ceiling_adjacencies: Boolean to note whether adjacencies should be
             solved between interior stories when Room2D floor and ceiling
             geometries are coplanar. This ensures that Surface boundary
-            conditions are used instead of Adiabatic ones. Note that this input
-            has no effect when the object_per_model is Story. (Default: False).
+            conditions are used instead of Adiabatic ones. (Default: False).
         color_by: Text that dictates the colors of the Model geometry.
             If none, only a wireframe of the Model will be generated, assuming
             include_wireframe is True. This is useful when the primary purpose of
@@ -71,16 +73,33 @@ def model_to_vis_set(
 
         hide_grid: Boolean to note whether the SensorGrid ContextGeometry should be
             hidden or shown by default. (Default: False).
+        use_cache: Boolean to note whether the Honeybee Model translated from the
+            Dragonfly Model should be cached and reused the next time the same
+            Model object is visualized with the same translation inputs. This
+            speeds up repeated visualization of the same Model but it assumes
+            that the Model is not edited between calls. Cached Models are kept
+            in memory until the clear_cache function of this module is called,
+            which should be done after editing a Model. (Default: False).
 
     Returns:
         A VisualizationSet object that represents the model.
     """
+    # if only sensor grids can be displayed and there are none, skip the translation
+    if str(color_by).lower() == 'none' and not include_wireframe and not room_attrs \
+            and not face_attrs and (str(grid_display_mode).lower() == 'none'
+                                    or not _has_grid_parameters(model)):
+        from ladybug_display.visualization import VisualizationSet
+        # the District Honeybee Model takes its name from the first Building
+        id_obj = model.buildings[0] if len(model.buildings) != 0 else model
+        vis_set = VisualizationSet(id_obj.identifier, [], model.units)
+        vis_set.display_name = id_obj.display_name
+        return vis_set
+
     # create the Honeybee Model from the Dragonfly one
-    hb_model = model.to_honeybee(
-        'District', use_multiplier=use_multiplier, exclude_plenums=exclude_plenums,
-        solve_ceiling_adjacencies=solve_ceiling_adjacencies,
-        enforce_adj=False, enforce_solid=True)[0]
+    hb_model = _to_honeybee(model, use_multiplier, exclude_plenums,
+                            solve_ceiling_adjacencies, use_cache)
     # convert the Honeybee Model to a VisualizationSet
+    from honeybee_display.model import model_to_vis_set as hb_model_to_vis_set
     return hb_model_to_vis_set(
         hb_model, color_by, include_wireframe, use_mesh, hide_color_by,
         room_attrs, face_attrs, grid_display_mode, hide_grid)
@@ -88,7 +107,8 @@ def model_to_vis_set(
 
 def model_comparison_to_vis_set(
         base_model, incoming_model, use_multiplier=True, exclude_plenums=False,
-        solve_ceiling_adjacencies=False, base_color=None, incoming_color=None):
+        solve_ceiling_adjacencies=False, base_color=None, incoming_color=None,
+        use_cache=False, parallel=False):
     """Translate two Dragonfly Models to be compared to a VisualizationSet.
 
     Args:
@@ -111,22 +131,110 @@ def model_comparison_to_vis_set(
         solve_ceiling_adjacencies: Boolean to note whether adjacencies should be
             solved between interior stories when Room2D floor and ceiling
             geometries are coplanar. This ensures that Surface boundary
-            conditions are used instead of Adiabatic ones. Note that this input
-            has no effect when the object_per_model is Story. (Default: False).
+            conditions are used instead of Adiabatic ones. (Default: False).
         base_color: An optional ladybug Color to set the color of the base model.
             If None, a default blue color will be used. (Default: None).
         incoming_color: An optional ladybug Color to set the color of the incoming model.
             If None, a default red color will be used. (Default: None).
+        use_cache: Boolean to note whether the Honeybee Models translated from the
+            Dragonfly Models should be cached and reused the next time the same
+            Model objects are visualized with the same translation inputs. This
+            assumes that the Models are not edited between calls. Cached Models
+            are kept in memory until the clear_cache function of this module
+            is called. (Default: False).
+        parallel: Boolean to note whether the two Dragonfly Models should be
+            translated to Honeybee on separate threads at the same time. This
+            is mostly useful in Python implementations without a global
+            interpreter lock, such as IronPython. (Default: False).
     """
     # create the Honeybee Models from the Dragonfly ones
-    base_model = base_model.to_honeybee(
-        'District', use_multiplier=use_multiplier, exclude_plenums=exclude_plenums,
-        solve_ceiling_adjacencies=solve_ceiling_adjacencies,
-        enforce_adj=False, enforce_solid=True)[0]
-    incoming_model = incoming_model.to_honeybee(
+    if parallel:
+        base_model, incoming_model = _to_honeybee_parallel(
+            (base_model, incoming_model), use_multiplier, exclude_plenums,
+            solve_ceiling_adjacencies, use_cache)
+    else:
+        base_model = _to_honeybee(base_model, use_multiplier, exclude_plenums,
+                                  solve_ceiling_adjacencies, use_cache)
+        incoming_model = _to_honeybee(incoming_model, use_multiplier, exclude_plenums,
+                                      solve_ceiling_adjacencies, use_cache)
+    # the incoming model is converted to the base units in place; protect the cache
+    if use_cache and incoming_model.units != base_model.units:
+        incoming_model = incoming_model.duplicate()
+    # convert the Honeybee Models to a VisualizationSet
+    from honeybee_display.model import model_comparison_to_vis_set as \
+        hb_model_comparison_to_vis_set
+    return hb_model_comparison_to_vis_set(
+        base_model, incoming_model, base_color, incoming_color)
+
+
+def clear_cache():
+    """Clear all Honeybee Models cached by the use_cache input of this module.
+
+    This releases the memory held by the cached Models and it should be called
+    after editing a Dragonfly Model that was visualized with use_cache set to
+    True so that the edits are reflected in the next visualization.
+    """
+    _HB_MODEL_CACHE.clear()
+
+
+def _to_honeybee(model, use_multiplier, exclude_plenums, solve_ceiling_adjacencies,
+                 use_cache=False):
+    """Translate a Dragonfly Model to a single Honeybee Model for display.
+
+    When use_cache is True, the result is stored under the id of the Dragonfly
+    Model and the translation inputs. The cache keeps a reference to the Dragonfly
+    Model so that its id cannot be reused by another object while it is cached.
+    """
+    if use_cache:
+        key = (id(model), use_multiplier, exclude_plenums, solve_ceiling_adjacencies)
+        try:
+            return _HB_MODEL_CACHE[key][1]
+        except KeyError:  # the model has not been translated yet
+            pass
+    hb_model = model.to_honeybee(
         'District', use_multiplier=use_multiplier, exclude_plenums=exclude_plenums,
         solve_ceiling_adjacencies=solve_ceiling_adjacencies,
         enforce_adj=False, enforce_solid=True)[0]
-    # convert the Honeybee Model to a VisualizationSet
-    return hb_model_comparison_to_vis_set(
-        base_model, incoming_model, base_color, incoming_color)
+    if use_cache:
+        _HB_MODEL_CACHE[key] = (model, hb_model)
+        while len(_HB_MODEL_CACHE) > _HB_MODEL_CACHE_SIZE:
+            _HB_MODEL_CACHE.popitem(last=False)
+    return hb_model
+
+
+def _to_honeybee_parallel(models, *args):
+    """Translate several Dragonfly Models to Honeybee Models on separate threads.
+
+    Any exception raised while translating one of the Models is re-raised here.
+    """
+    results = [None] * len(models)
+
+    def _translate(i):
+        try:
+            results[i] = (True, _to_honeybee(models[i], *args))
+        except Exception as e:
+            results[i] = (False, e)
+
+    threads = [threading.Thread(target=_translate, args=(i,))
+               for i in range(len(models))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    hb_models = []
+    for success, result in results:
+        if not success:
+            raise result
+        hb_models.append(result)
+    return hb_models
+
+
+def _has_grid_parameters(model):
+    """Check whether any Room2D of a Dragonfly Model will generate a SensorGrid."""
+    try:
+        for room in model.room_2ds:
+            if len(room.properties.radiance.grid_parameters) != 0:
+                return True
+    except AttributeError:  # dragonfly-radiance is not installed
+        pass
+    return False
@@ -1,9 +1,14 @@
 """Test cli."""
 import os
+import base64
 import time
+import pytest
 from click.testing import CliRunner
 
 from ladybug.commandutil import run_command_function
+from ladybug_display.visualization import VisualizationSet
+from dragonfly.model import Model
+import dragonfly_display.cli as display_cli
 from dragonfly_display.cli import model_to_vis_set_cli, model_to_vis_set, \
     model_comparison_to_vis_set_cli, model_comparison_to_vis_set
 
@@ -46,6 +51,102 @@ def test_model_to_vis_set():
     os.remove(output_vis)
 
 
+def test_model_to_vis_set_cache(tmp_path, monkeypatch):
+    """Test the model_to_vis_set function with a cache of the parsed model."""
+    cache_folder = str(tmp_path / 'cache')
+    monkeypatch.setattr(display_cli, '_cache_folder', lambda: cache_folder)
+    loaded_files = []
+    model_from_file = display_cli._model_from_file
+
+    def _record_model_from_file(model_file):
+        loaded_files.append(model_file)
+        return model_from_file(model_file)
+    monkeypatch.setattr(display_cli, '_model_from_file', _record_model_from_file)
+
+    input_model = './tests/json/model_with_doors_skylights.dfjson'
+    vis_str = model_to_vis_set(input_model)
+    cache_vis_str = model_to_vis_set(input_model, cache=True)
+    assert cache_vis_str == vis_str
+    cache_files = os.listdir(cache_folder)
+    assert len(cache_files) == 1 and cache_files[0].endswith('.dfpkl')
+    cache_file = os.path.join(cache_folder, cache_files[0])
+
+    cache_vis_str = model_to_vis_set(input_model, cache=True)
+    assert cache_vis_str == vis_str
+    assert loaded_files[-1] == cache_file
+
+    # the cache must not be used if other users can write to its folder
+    os.chmod(cache_folder, 0o777)
+    model_to_vis_set(input_model, cache=True)
+    assert loaded_files[-1] == input_model
+
+
+def test_model_to_vis_set_dfpkl():
+    """Test the model_to_vis_set function with a DFpkl model file."""
+    input_model = './tests/json/model_with_doors_skylights.dfjson'
+    model = Model.from_file(input_model)
+    input_pkl = model.to_dfpkl('model_with_doors_skylights', './tests/json')
+    vis_str = model_to_vis_set(input_pkl)
+    assert vis_str == model_to_vis_set(input_model)
+    os.remove(input_pkl)
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_model_to_vis_set_leading_whitespace(tmp_path, monkeypatch, use_orjson):
+    """Test the model_to_vis_set function with a DFJSON that has leading whitespace."""
+    if not use_orjson:  # test the standard library fallback
+        monkeypatch.setattr(display_cli, 'orjson', None)
+    input_model = './tests/json/model_with_doors_skylights.dfjson'
+    with open(input_model, 'rb') as inf:
+        model_bytes = inf.read()
+    for prefix in (b'\n', b' \r\n\t', b'\xef\xbb\xbf\n'):
+        ws_model = str(tmp_path / 'leading_whitespace.dfjson')
+        with open(ws_model, 'wb') as outf:
+            outf.write(prefix + model_bytes)
+        assert model_to_vis_set(ws_model) == model_to_vis_set(input_model)
+
+
+def test_model_to_vis_set_bad_format():
+    """Test that an invalid output format fails before the model is loaded."""
+    input_model = './tests/json/not_a_model.dfjson'
+    with pytest.raises(ValueError):
+        model_to_vis_set(input_model, output_format='vtk')
+
+    input_model = './tests/json/model_with_doors_skylights.dfjson'
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'vtk']
+    result = runner.invoke(model_to_vis_set_cli, cmd_args)
+    assert result.exit_code == 2
+
+
+def test_model_to_vis_set_obj():
+    """Test that the obj output format returns the VisualizationSet itself."""
+    input_model = './tests/json/model_with_doors_skylights.dfjson'
+    vis_set = model_to_vis_set(input_model, output_format='obj')
+    assert isinstance(vis_set, VisualizationSet)
+    assert len(vis_set) > 0
+
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'obj']
+    result = runner.invoke(model_to_vis_set_cli, cmd_args)
+    assert result.exit_code == 2
+
+
+def test_model_to_vis_set_vtkjs_stdout():
+    """Test that vtkjs printed to stdout is base64 unless raw output is requested."""
+    input_model = './tests/json/model_with_doors_skylights.dfjson'
+    runner = CliRunner()
+    cmd_args = [input_model, '--output-format', 'vtkjs']
+    result = runner.invoke(model_to_vis_set_cli, cmd_args)
+    assert result.exit_code == 0
+    assert base64.b64decode(result.stdout_bytes)[:4] == b'PK\x03\x04'
+
+    cmd_args.append('--raw-vtkjs')
+    result = runner.invoke(model_to_vis_set_cli, cmd_args)
+    assert result.exit_code == 0
+    assert result.stdout_bytes[:4] == b'PK\x03\x04'
+
+
 def test_model_comparison_to_vis_set_cli():
     """Test the model_comparison_to_vis_set function that runs within the CLI."""
     base_model = './tests/json/base_model.dfjson'
@@ -63,7 +164,7 @@ def test_model_comparison_to_vis_set_cli():
     os.remove(output_vis)
 
 
-def test_model_comparison_to_vis_set():
+def test_model_comparison_to_vis_set(tmp_path, monkeypatch):
     """Test the model_comparison_to_vis_set function."""
     base_model = './tests/json/base_model.dfjson'
     incoming_model = './tests/json/incoming_model.dfjson'
@@ -73,3 +174,12 @@ def test_model_comparison_to_vis_set():
 
     assert isinstance(vtkjs_str, str)
     assert len(vtkjs_str) > 1000
+
+    cache_folder = str(tmp_path / 'cache')
+    monkeypatch.setattr(display_cli, '_cache_folder', lambda: cache_folder)
+    cmd_options['--cache'] = ''
+    cache_vtkjs_str = run_command_function(
+        model_comparison_to_vis_set, cmd_args, cmd_options)
+    assert isinstance(cache_vtkjs_str, str)
+    assert len(cache_vtkjs_str) > 1000
+    assert len(os.listdir(cache_folder)) == 2
@@ -5,6 +5,7 @@ from ladybug_display.visualization import VisualizationSet, \
     ContextGeometry, AnalysisGeometry, VisualizationData
 from dragonfly.model import Model
 from honeybee_display.attr import RoomAttribute, FaceAttribute
+from dragonfly_display.model import clear_cache, _HB_MODEL_CACHE
 
 
 def test_default_to_vis_set():
@@ -34,6 +35,11 @@ def test_default_to_vis_set():
         assert isinstance(geo_obj, ContextGeometry)
         assert isinstance(geo_obj[0], DisplayLineSegment3D)
 
+    vis_set = parsed_model.to_vis_set(color_by='none', include_wireframe=False)
+    assert len(vis_set) == 0
+    vis_set = parsed_model.to_vis_set(color_by=None, include_wireframe=False)
+    assert len(vis_set) == 0
+
     vis_set = parsed_model.to_vis_set(
         color_by='boundary_condition', include_wireframe=False)
     assert len(vis_set) == 5
@@ -78,3 +84,55 @@ def test_face_attr_to_vis_set():
     assert len(vis_set[0]) == 324
     for item in vis_set[0]:
         assert isinstance(item, DisplayText3D)
+
+
+def test_empty_to_vis_set_identity():
+    """Test that an empty VisualizationSet is named like the full translation."""
+    parsed_model = Model.from_dfjson('./tests/json/base_model.dfjson')
+    vis_set = parsed_model.to_vis_set(color_by='none', include_wireframe=False)
+    full_vis_set = parsed_model.to_vis_set(color_by='none')
+    assert len(vis_set) == 0
+    assert full_vis_set.identifier != parsed_model.identifier
+    assert vis_set.identifier == full_vis_set.identifier
+    assert vis_set.display_name == full_vis_set.display_name
+
+
+def test_to_vis_set_use_cache():
+    """Test the Model.to_vis_set() method with a cached Honeybee Model."""
+    model_json = './tests/json/model_with_doors_skylights.dfjson'
+    parsed_model = Model.from_dfjson(model_json)
+    vis_set = parsed_model.to_vis_set(use_cache=True)
+    cached_vis_set = parsed_model.to_vis_set(use_cache=True)
+    assert len(vis_set) == len(cached_vis_set) == 10
+    assert len(parsed_model.to_vis_set(use_multiplier=False, use_cache=True)) == 10
+    assert len(_HB_MODEL_CACHE) != 0
+    clear_cache()
+    assert len(_HB_MODEL_CACHE) == 0
+
+
+def test_to_vis_set_comparison_parallel():
+    """Test the Model.to_vis_set_comparison() method with parallel translation."""
+    base_model = Model.from_dfjson('./tests/json/base_model.dfjson')
+    incoming_model = Model.from_dfjson('./tests/json/incoming_model.dfjson')
+    vis_set = base_model.to_vis_set_comparison(incoming_model)
+    par_vis_set = base_model.to_vis_set_comparison(incoming_model, parallel=True)
+    assert isinstance(par_vis_set, VisualizationSet)
+    assert len(par_vis_set) == len(vis_set)
+
+
+def test_to_vis_set_comparison_use_cache_units():
+    """Test that cached Models are not changed by a comparison with other units."""
+    base_model = Model.from_dfjson('./tests/json/base_model.dfjson')
+    incoming_model = Model.from_dfjson('./tests/json/incoming_model.dfjson')
+    incoming_model.convert_to_units('Feet')
+    assert base_model.units != incoming_model.units
+    clear_cache()
+    vis_set = base_model.to_vis_set_comparison(incoming_model, use_cache=True)
+    hb_models = [v[1] for v in _HB_MODEL_CACHE.values() if v[0] is incoming_model]
+    assert len(hb_models) == 1
+    hb_dict = hb_models[0].to_dict()
+    cached_vis_set = base_model.to_vis_set_comparison(incoming_model, use_cache=True)
+    assert hb_models[0].units == 'Feet'
+    assert hb_models[0].to_dict() == hb_dict
+    assert len(cached_vis_set) == len(vis_set)
+    clear_cache()